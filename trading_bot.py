@@ -44,9 +44,16 @@ import os
 import time
 import csv
 import math
+import json
+import io
+import logging
 import base64
+import hashlib
 import calendar
 import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
@@ -55,15 +62,73 @@ from typing import Any, Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 import requests
-import feedparser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yfinance as yf
-import mplfinance as mpf
 
 from flask import Flask, render_template_string, send_file
 
-from ta.momentum import RSIIndicator
-from ta.trend import MACD, EMAIndicator
-from ta.volatility import AverageTrueRange
+# yfinance returns an empty frame instead of raising on a failed download and
+# logs the reason at ERROR; keep that, but drop its chattier warnings.
+logging.getLogger("yfinance").setLevel(logging.ERROR)
+
+# numba is optional. Without it the EMA recurrences fall back to pandas'
+# vectorized ewm and produce the same values.
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# orjson is optional; it parses and serializes the Gemini traffic several
+# times faster than the stdlib json module.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps_bytes = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# matplotlib and feedparser are heavy and only needed on report ticks or when
+# the news feed changes; they are imported on first use.
+Figure = None
+FigureCanvasAgg = None
+LineCollection = None
+Image = None
+feedparser = None
+
+
+def load_matplotlib() -> Any:
+    # pyplot is never imported: its figure registry and backend probing are
+    # not needed for a headless bot that renders straight to PNG bytes.
+    global Figure, FigureCanvasAgg, LineCollection, Image
+    if Figure is None:
+        from matplotlib.figure import Figure as _Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg as _FigureCanvasAgg
+        from matplotlib.collections import LineCollection as _LineCollection
+        from PIL import Image as _Image  # Pillow ships as a matplotlib dependency
+        FigureCanvasAgg = _FigureCanvasAgg
+        LineCollection = _LineCollection
+        Image = _Image
+        Figure = _Figure
+    return Figure
+
+
+def load_feedparser() -> Any:
+    global feedparser
+    if feedparser is None:
+        import feedparser as _feedparser
+        feedparser = _feedparser
+    return feedparser
 
 
 # =============================================================================
@@ -71,21 +136,55 @@ from ta.volatility import AverageTrueRange
 # =============================================================================
 
 GEMINI_KEY = os.environ.get("GEMINI_API_KEY")
+# Pin a model (e.g. "models/gemini-1.5-flash") to skip model discovery entirely.
+GEMINI_MODEL = os.environ.get("GEMINI_MODEL")
 TELEGRAM_TOKEN = os.environ.get("TELEGRAM_TOKEN")
 TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID")
 
 TICKER = os.environ.get("WTI_TICKER", "CL=F")
+# Cross-asset context for the Gemini prompt, downloaded in the same request as
+# the 1h WTI bars (space separated, empty to disable).
+CONTEXT_TICKERS = os.environ.get("CONTEXT_TICKERS", "BZ=F NG=F").split()
+CONTEXT_INTERVAL = "1h"
 PORT = int(os.environ.get("PORT", 8080))
 
 # Main monitoring cadence
 LOOP_SLEEP_SECONDS = int(os.environ.get("LOOP_SLEEP_SECONDS", 120))
 MAIN_REPORT_INTERVAL_SECONDS = int(os.environ.get("MAIN_REPORT_INTERVAL_SECONDS", 1800))  # 30 minutes
+# Both cadences are aligned to wall-clock multiples (bar closes) plus this
+# grace period so Yahoo has printed the closed bar before it is fetched.
+BAR_CLOSE_GRACE_SECONDS = int(os.environ.get("BAR_CLOSE_GRACE_SECONDS", 5))
 FRESH_NEWS_SECONDS = int(os.environ.get("FRESH_NEWS_SECONDS", 900))  # 15 minutes
+# News is polled on its own timer: every NEWS_POLL_MIN_SECONDS while the newest
+# story is minutes old, backing off to NEWS_POLL_MAX_SECONDS when the feed is quiet.
+NEWS_POLL_MIN_SECONDS = int(os.environ.get("NEWS_POLL_MIN_SECONDS", 30))
+NEWS_POLL_MAX_SECONDS = int(os.environ.get("NEWS_POLL_MAX_SECONDS", 600))
+# Links already alerted on. Older entries can never be "breaking" again, so the
+# set is bounded by age and size.
+SEEN_NEWS_TTL_SECONDS = 86400
+SEEN_NEWS_MAX_LINKS = 1000
 FAST_SPIKE_THRESHOLD = float(os.environ.get("FAST_SPIKE_THRESHOLD", 0.50))  # $0.50 move between checks
 
+# After the first full download only this much recent history is fetched;
+# the indicators are advanced over the new bars instead of recomputed.
+MARKET_REFRESH_PERIOD = os.environ.get("MARKET_REFRESH_PERIOD", "2d")
+# Periodically redo the full download and recompute so any revision Yahoo makes
+# outside the refresh window cannot drift into the running recurrences.
+MARKET_FULL_RECOMPUTE_SECONDS = int(os.environ.get("MARKET_FULL_RECOMPUTE_SECONDS", 86400))
+# Minimum age before an interval is downloaded again. A bar closing always
+# forces a refresh. 15m carries the live price and spike check, so it
+# refreshes every market tick; the 1h bars only confirm and can lag a few minutes
+# (the 15m/1h price-disagreement check then uses the last completed 1h bar).
+MARKET_TTL_SECONDS = {
+    "15m": int(os.environ.get("MARKET_TTL_15M_SECONDS", 0)),
+    "1h": int(os.environ.get("MARKET_TTL_1H_SECONDS", 300)),
+}
+INTERVAL_SECONDS = {"15m": 900, "1h": 3600}
+
 # Telegram behavior
 MUTE_WAIT_SIGNALS = True
 SEND_CHART_WITH_TELEGRAM = True
+TELEGRAM_CAPTION_LIMIT = 1024  # sendPhoto caption limit
 
 # If your broker price is different from Yahoo by more than this, be careful.
 PRICE_DISAGREEMENT_LIMIT = 0.40
@@ -134,10 +233,21 @@ PRE_OPEN_PREVIEW_INTERVAL_SECONDS = int(os.environ.get("PRE_OPEN_PREVIEW_INTERVA
 OPENING_ACTIVE_ALERT_INTERVAL_SECONDS = int(os.environ.get("OPENING_ACTIVE_ALERT_INTERVAL_SECONDS", 900))
 
 # Files
-CHART_FILE = "oil_chart.png"
+CHART_FILENAME = "oil_chart.png"  # upload name; the chart itself is kept in memory
 INTRADAY_LOG_FILE = "intraday_alert_log.csv"
 OPENING_SPIKE_LOG_FILE = "opening_spike_audit_log.csv"
 WEEKEND_HISTORY_FILE = "weekend_opening_history.csv"
+MODEL_CACHE_FILE = ".model_cache.json"
+MARKET_CACHE_FILE = "market_cache.pkl"
+NEWS_CACHE_FILE = "news_cache.pkl"
+
+# The Gemini model list changes rarely; rediscover it at most this often.
+MODEL_CACHE_TTL_SECONDS = int(os.environ.get("MODEL_CACHE_TTL_SECONDS", 21600))  # 6 hours
+# Reuse the previous Gemini explanation while the market state is unchanged.
+EXPLANATION_CACHE_TTL_SECONDS = int(os.environ.get("EXPLANATION_CACHE_TTL_SECONDS", 1200))  # 20 minutes
+# Intraday reports whose |score| reaches this are decisive on their own and use
+# the rule-based explanation without a Gemini call (0 = always ask Gemini).
+GEMINI_SKIP_ABS_SCORE = float(os.environ.get("GEMINI_SKIP_ABS_SCORE", 0))
 
 
 # =============================================================================
@@ -146,6 +256,48 @@ WEEKEND_HISTORY_FILE = "weekend_opening_history.csv"
 
 app = Flask(__name__)
 
+# Shared pool for overlapping independent network calls
+# (Yahoo 15m/1h downloads, Google News, Gemini model discovery).
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bot-io")
+
+# One keep-alive session for Gemini, Telegram and Google News so TLS
+# handshakes are paid once per host instead of once per call.
+# Retry only covers idempotent methods, so a Telegram send is never duplicated.
+# Retry-After is ignored: a throttled feed could otherwise hold the news future,
+# and the loop waiting on it, for hours.
+# Gemini calls have no side effects, so its POSTs are retried as well, except
+# on 429: an exhausted quota only burns more of it.
+HTTP_TIMEOUT = (5, 30)  # (connect, read) seconds
+GEMINI_STREAM_TIMEOUT = (5, 60)  # read timeout applies between streamed chunks
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=False,
+        ),
+    ),
+)
+SESSION.mount(
+    "https://generativelanguage.googleapis.com/",
+    HTTPAdapter(
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[s for s in RETRY_STATUSES if s != 429],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            respect_retry_after_header=False,
+        ),
+    ),
+)
+
 DASHBOARD_DATA: Dict[str, Any] = {
     "status": "Booting...",
     "last_update": "N/A",
@@ -428,16 +580,18 @@ def safe_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
-def clamp(value: float, low: float, high: float) -> float:
-    return max(low, min(high, value))
+def last_value(df: pd.DataFrame, column: str, default: float = 0.0) -> float:
+    """Last value of `column` read straight from the frame, without building a Series."""
+    return safe_float(df.iat[-1, df.columns.get_loc(column)], default)
 
 
-def flatten_yfinance_columns(df: pd.DataFrame) -> pd.DataFrame:
-    if df is None or df.empty:
-        return df
-    if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.get_level_values(0)
-    return df
+def last_row(df: pd.DataFrame) -> Dict[str, Any]:
+    """Last bar as a plain dict: one row extraction, then cheap key lookups."""
+    return dict(zip(df.columns, df.iloc[-1].tolist()))
+
+
+def clamp(value: float, low: float, high: float) -> float:
+    return max(low, min(high, value))
 
 
 def ensure_utc_index(df: pd.DataFrame) -> pd.DataFrame:
@@ -475,76 +629,443 @@ def clean_title(title: str) -> str:
 # 5. MARKET DATA
 # =============================================================================
 
-def add_indicators(df: pd.DataFrame) -> pd.DataFrame:
-    if df is None or df.empty or len(df) < 60:
-        return df
+OHLC_COLUMNS = ["Open", "High", "Low", "Close"]
+
+RSI_WINDOW = 14
+ATR_WINDOW = 14
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL_WINDOW = 9
+EMA_WINDOWS = (21, 50, 200)
+
+# EMA200 is only published from this many bars. Incremental updates also only
+# resume past this point, so every warm-up window is already settled.
+INDICATOR_WARMUP_BARS = 220
+
+INDICATOR_STATE_KEYS = (
+    "RSI_GAIN",
+    "RSI_LOSS",
+    "MACD_FAST",
+    "MACD_SLOW",
+    "MACD_SIGNAL",
+    "ATR",
+) + tuple(f"EMA{w}" for w in EMA_WINDOWS)
+
+# Per-interval cache of the last bars and the raw indicator recurrences
+# (running EMAs, Wilder averages) aligned with them.
+MARKET_CACHE: Dict[str, Dict[str, Any]] = {}
+
+# Last price and 24h change of each CONTEXT_TICKERS symbol.
+CONTEXT_PRICES: Dict[str, Dict[str, float]] = {}
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def ewm_nb(values: np.ndarray, alpha: float, out: np.ndarray, start: int, origin: int) -> None:
+        """
+        Advance out[i] = out[i-1] + alpha * (values[i] - out[i-1]) in place from
+        `start`. The recursion is seeded with out[origin] = values[origin].
+        Same result as pandas ewm(alpha=alpha, adjust=False).
+        """
+        for i in range(max(start, origin), len(values)):
+            if i == origin:
+                out[i] = values[i]
+            else:
+                out[i] = out[i - 1] + alpha * (values[i] - out[i - 1])
+else:
+    def ewm_nb(values: np.ndarray, alpha: float, out: np.ndarray, start: int, origin: int) -> None:
+        """Pandas version of the kernel above; resumes by seeding with out[first - 1]."""
+        first = max(start, origin)
+        if first >= len(values):
+            return
+        if first == origin:
+            out[first:] = pd.Series(values[first:]).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+        else:
+            seeded = np.r_[out[first - 1], values[first:]]
+            out[first:] = pd.Series(seeded).ewm(alpha=alpha, adjust=False).mean().to_numpy()[1:]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def macd_nb(
+        close: np.ndarray,
+        fast_alpha: float,
+        slow_alpha: float,
+        signal_alpha: float,
+        fast: np.ndarray,
+        slow: np.ndarray,
+        signal: np.ndarray,
+        start: int,
+        signal_origin: int,
+    ) -> None:
+        """
+        Advance the fast, slow and signal EMAs of MACD in one pass from `start`.
+        Same values as three ewm_nb calls; the signal EMA is seeded with the
+        MACD line at `signal_origin`.
+        """
+        for i in range(start, len(close)):
+            if i == 0:
+                fast[i] = close[i]
+                slow[i] = close[i]
+            else:
+                fast[i] = fast[i - 1] + fast_alpha * (close[i] - fast[i - 1])
+                slow[i] = slow[i - 1] + slow_alpha * (close[i] - slow[i - 1])
+            if i == signal_origin:
+                signal[i] = fast[i] - slow[i]
+            elif i > signal_origin:
+                signal[i] = signal[i - 1] + signal_alpha * ((fast[i] - slow[i]) - signal[i - 1])
+else:
+    def macd_nb(
+        close: np.ndarray,
+        fast_alpha: float,
+        slow_alpha: float,
+        signal_alpha: float,
+        fast: np.ndarray,
+        slow: np.ndarray,
+        signal: np.ndarray,
+        start: int,
+        signal_origin: int,
+    ) -> None:
+        """Pandas version of the kernel above, built from the ewm_nb fallback."""
+        ewm_nb(close, fast_alpha, fast, start, 0)
+        ewm_nb(close, slow_alpha, slow, start, 0)
+        ewm_nb(fast - slow, signal_alpha, signal, start, signal_origin)
+
+
+def advance_indicator_state(
+    df: pd.DataFrame,
+    prev: Optional[Dict[str, np.ndarray]] = None,
+    start: int = 0,
+) -> Dict[str, np.ndarray]:
+    """
+    Run the indicator recurrences for rows >= start and copy earlier rows from
+    `prev`. A refresh that only adds or revises the last bar costs O(new bars).
+    """
+    if prev is None or start < INDICATOR_WARMUP_BARS:
+        start = 0
+
+    n = len(df)
+    close = df["Close"].to_numpy(dtype=np.float64)
+    high = df["High"].to_numpy(dtype=np.float64)
+    low = df["Low"].to_numpy(dtype=np.float64)
+
+    state: Dict[str, np.ndarray] = {}
+    for key in INDICATOR_STATE_KEYS:
+        arr = np.full(n, np.nan)
+        if start > 0:
+            arr[:start] = prev[key][:start]
+        state[key] = arr
+
+    # Per-bar inputs, only for the rows being advanced.
+    first = max(start, 1)
+    prev_close = close[first - 1:-1]
+    delta = close[first:] - prev_close
+
+    gain = np.zeros(n)
+    loss = np.zeros(n)
+    gain[first:] = np.where(delta > 0, delta, 0.0)
+    loss[first:] = np.where(delta < 0, -delta, 0.0)
+
+    true_range = np.zeros(n)
+    true_range[0] = high[0] - low[0]
+    true_range[first:] = np.maximum.reduce([
+        high[first:] - low[first:],
+        np.abs(high[first:] - prev_close),
+        np.abs(low[first:] - prev_close),
+    ])
+
+    rsi_alpha = 1.0 / RSI_WINDOW
+    ewm_nb(gain, rsi_alpha, state["RSI_GAIN"], start, 0)
+    ewm_nb(loss, rsi_alpha, state["RSI_LOSS"], start, 0)
+
+    for w in EMA_WINDOWS:
+        ewm_nb(close, 2.0 / (w + 1), state[f"EMA{w}"], start, 0)
+
+    macd_nb(
+        close,
+        2.0 / (MACD_FAST + 1),
+        2.0 / (MACD_SLOW + 1),
+        2.0 / (MACD_SIGNAL_WINDOW + 1),
+        state["MACD_FAST"],
+        state["MACD_SLOW"],
+        state["MACD_SIGNAL"],
+        start,
+        max(MACD_FAST, MACD_SLOW) - 1,
+    )
 
-    df = df.copy()
-    for col in ["Open", "High", "Low", "Close"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+    # Wilder ATR: zero before the first window, then seeded with the mean TR.
+    atr = state["ATR"]
+    if start < ATR_WINDOW:
+        atr[:ATR_WINDOW - 1] = 0.0
+        atr[ATR_WINDOW - 1] = true_range[:ATR_WINDOW].mean()
+    ewm_nb(true_range, 1.0 / ATR_WINDOW, atr, max(start, ATR_WINDOW), ATR_WINDOW - 1)
 
-    df = df.dropna(subset=["Open", "High", "Low", "Close"])
-    if len(df) < 60:
-        return df
+    return state
 
-    close = df["Close"]
-    df["RSI"] = RSIIndicator(close=close, window=14).rsi()
 
-    macd = MACD(close=close)
-    df["MACD"] = macd.macd()
-    df["MACD_SIGNAL"] = macd.macd_signal()
-    df["MACD_HIST"] = df["MACD"] - df["MACD_SIGNAL"]
+def add_indicators(
+    df: pd.DataFrame,
+    prev_state: Optional[Dict[str, np.ndarray]] = None,
+    start: int = 0,
+) -> Tuple[pd.DataFrame, Optional[Dict[str, np.ndarray]]]:
+    """
+    Adds indicator columns. Matches ta's RSI/MACD/EMA/ATR, including the NaN
+    warm-up rows and ATR zeros before the first full window.
+    """
+    if df is None or df.empty or len(df) < 60:
+        return df, None
+
+    state = advance_indicator_state(df, prev_state, start)
+    n = len(df)
+
+    close = df["Close"].to_numpy(dtype=float)
+    cols: Dict[str, np.ndarray] = {}
+
+    gain = state["RSI_GAIN"]
+    loss = state["RSI_LOSS"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(loss == 0, 100.0, 100.0 - 100.0 / (1.0 + gain / loss))
+    rsi[:RSI_WINDOW - 1] = np.nan
+    cols["RSI"] = rsi
+
+    macd = state["MACD_FAST"] - state["MACD_SLOW"]
+    macd[:max(MACD_FAST, MACD_SLOW) - 1] = np.nan
+    macd_signal = state["MACD_SIGNAL"].copy()
+    macd_signal[:max(MACD_FAST, MACD_SLOW) + MACD_SIGNAL_WINDOW - 2] = np.nan
+    cols["MACD"] = macd
+    cols["MACD_SIGNAL"] = macd_signal
+    cols["MACD_HIST"] = macd - macd_signal
+
+    atr = state["ATR"].copy()
+    cols["ATR"] = atr
+
+    for w in EMA_WINDOWS:
+        ema = state[f"EMA{w}"].copy()
+        ema[:w - 1] = np.nan
+        if w == 200 and n < INDICATOR_WARMUP_BARS:
+            ema[:] = np.nan
+        cols[f"EMA{w}"] = ema
+
+    atr_mean = np.full(n, np.nan)
+    atr_mean[49:] = np.lib.stride_tricks.sliding_window_view(atr, 50).mean(axis=1)
+    cols["ATR_MEAN_50"] = atr_mean
+
+    ret_1 = np.full(n, np.nan)
+    ret_1[1:] = close[1:] - close[:-1]
+    ret_4 = np.full(n, np.nan)
+    ret_4[4:] = close[4:] - close[:-4]
+    cols["RET_1"] = ret_1
+    cols["RET_4"] = ret_4
+
+    # Attach every indicator in one block instead of one column insert each.
+    df = pd.concat(
+        [df.drop(columns=list(cols), errors="ignore"), pd.DataFrame(cols, index=df.index)],
+        axis=1,
+    )
+    return df, state
 
-    df["ATR"] = AverageTrueRange(
-        high=df["High"],
-        low=df["Low"],
-        close=df["Close"],
-        window=14
-    ).average_true_range()
 
-    df["EMA21"] = EMAIndicator(close=close, window=21).ema_indicator()
-    df["EMA50"] = EMAIndicator(close=close, window=50).ema_indicator()
-    df["EMA200"] = EMAIndicator(close=close, window=200).ema_indicator() if len(df) >= 220 else np.nan
+def update_context_prices(raw: pd.DataFrame) -> None:
+    for ticker in CONTEXT_TICKERS:
+        try:
+            closes = pd.to_numeric(raw[ticker]["Close"], errors="coerce").dropna()
+            if closes.empty:
+                continue
+            closes = ensure_utc_index(closes.copy())
+            last = safe_float(closes.iloc[-1])
+            prev = safe_float(closes.asof(closes.index[-1] - pd.Timedelta(days=1)), last)
+            CONTEXT_PRICES[ticker] = {
+                "price": last,
+                "change_pct": (last / prev - 1) * 100 if prev else 0.0,
+            }
+        except Exception as e:
+            print(f"Context price error {ticker}: {e}")
+
+
+def fetch_bars(period: str, interval: str) -> Optional[pd.DataFrame]:
+    if interval == CONTEXT_INTERVAL and CONTEXT_TICKERS:
+        # One batched request instead of one round-trip per symbol.
+        raw = yf.download(
+            [TICKER] + CONTEXT_TICKERS,
+            period=period,
+            interval=interval,
+            group_by="ticker",
+            progress=False,
+            auto_adjust=False,
+        )
+        if raw is None or raw.empty:
+            print(f"Download empty {interval}")
+            return None
+        update_context_prices(raw)
+        df = raw[TICKER].copy()
+    else:
+        # A single symbol gains nothing from yfinance's per-ticker threads, and
+        # multi_level_index=False returns flat OHLC columns directly.
+        df = yf.download(
+            TICKER,
+            period=period,
+            interval=interval,
+            progress=False,
+            threads=False,
+            multi_level_index=False,
+            auto_adjust=False,
+        )
+    if df is None or df.empty:
+        print(f"Download empty {interval}")
+        return None
+    df = ensure_utc_index(df)
+    # Nothing downstream reads Volume or Adj Close; carry only OHLC through
+    # the merge, indicator and chart steps.
+    df = df[OHLC_COLUMNS].apply(pd.to_numeric, errors="coerce").astype(np.float64)
+    df = df.dropna(subset=OHLC_COLUMNS)
+    return df if not df.empty else None
 
-    df["ATR_MEAN_50"] = df["ATR"].rolling(50).mean()
-    df["RET_1"] = df["Close"].diff()
-    df["RET_4"] = df["Close"].diff(4)
 
-    return df
+def merge_new_bars(cached: pd.DataFrame, fresh: pd.DataFrame) -> Tuple[pd.DataFrame, Optional[int]]:
+    """
+    Overlay freshly downloaded bars on the cached ones.
+    Returns the merged bars and the first row whose OHLC is new or revised.
+    The row is None when the refresh does not overlap the cache (weekend gap,
+    outage), in which case a full download is needed.
+    """
+    if fresh.index[0] < cached.index[0] or fresh.index[0] > cached.index[-1]:
+        return fresh, None
+
+    head = cached.loc[cached.index < fresh.index[0]].reindex(columns=fresh.columns)
+    merged = pd.concat([head, fresh])
+
+    old = cached.iloc[len(head):]
+    m = min(len(old), len(fresh))
+    same = (old.index[:m] == fresh.index[:m]) & (
+        old[OHLC_COLUMNS].to_numpy()[:m] == fresh[OHLC_COLUMNS].to_numpy()[:m]
+    ).all(axis=1)
+    changed = np.flatnonzero(~same)
+    start = len(head) + (int(changed[0]) if len(changed) else m)
+    return merged, start
+
+
+def market_cache_fresh(cached: Dict[str, Any], interval: str, now: float) -> bool:
+    """True while the cached bars are younger than the interval's TTL and no bar has closed since."""
+    ttl = MARKET_TTL_SECONDS.get(interval, 0)
+    fetched_at = cached.get("fetched_at", 0.0)
+    if ttl <= 0 or now - fetched_at >= ttl:
+        return False
+    step = INTERVAL_SECONDS.get(interval)
+    if step is None:
+        return True
+    return (now - BAR_CLOSE_GRACE_SECONDS) // step == (fetched_at - BAR_CLOSE_GRACE_SECONDS) // step
 
 
 def download_interval(period: str, interval: str) -> Optional[pd.DataFrame]:
+    """
+    The first call downloads the full `period`. Later calls fetch only
+    MARKET_REFRESH_PERIOD, merge it into the cached bars and advance the
+    indicator recurrences over the new or revised bars (normally one).
+    Within the interval's MARKET_TTL_SECONDS the cached bars are returned as is.
+    """
     try:
-        df = yf.download(TICKER, period=period, interval=interval, progress=False, auto_adjust=False)
-        if df is None or df.empty:
-            return None
-        df = flatten_yfinance_columns(df)
-        df = ensure_utc_index(df)
-        df = add_indicators(df)
+        now = time.time()
+        cached = MARKET_CACHE.get(interval)
+        if cached is not None and market_cache_fresh(cached, interval, now):
+            return cached["df"]
+
+        if cached is not None and now - cached.get("full_at", 0.0) < MARKET_FULL_RECOMPUTE_SECONDS:
+            fresh = fetch_bars(MARKET_REFRESH_PERIOD, interval)
+            if fresh is None:
+                return None
+
+            merged, start = merge_new_bars(cached["df"], fresh)
+            if start is not None and start >= INDICATOR_WARMUP_BARS:
+                if start == len(merged) == len(cached["df"]):
+                    cached["fetched_at"] = now
+                    return cached["df"]
+
+                df, state = add_indicators(merged, cached["state"], start)
+
+                # Keep the same history length a full download would return.
+                keep = df.index >= df.index[-1] - pd.Timedelta(days=int(period.rstrip("d")))
+                if not keep.all():
+                    df = df.loc[keep]
+                    state = {key: arr[keep] for key, arr in state.items()}
+
+                MARKET_CACHE[interval] = {"df": df, "state": state, "full_at": cached["full_at"], "fetched_at": now}
+                return df
+
+        df = fetch_bars(period, interval)
+        df, state = add_indicators(df)
+        if state is not None:
+            MARKET_CACHE[interval] = {"df": df, "state": state, "full_at": now, "fetched_at": now}
+        else:
+            MARKET_CACHE.pop(interval, None)
         return df
     except Exception as e:
         print(f"Download error {interval}: {e}")
+        # Drop the entry so a bad cache cannot fail every following refresh.
+        MARKET_CACHE.pop(interval, None)
         return None
 
 
+def load_market_cache() -> None:
+    """
+    Restore the cached bars and indicator state from the last run so a restart
+    refreshes incrementally. A stale cache simply fails the overlap check in
+    merge_new_bars and falls back to a full download; entries written with a
+    different indicator layout are dropped.
+    """
+    if not os.path.exists(MARKET_CACHE_FILE):
+        return
+    try:
+        for interval, entry in pd.read_pickle(MARKET_CACHE_FILE).items():
+            if (
+                set(entry.get("state", {})) != set(INDICATOR_STATE_KEYS)
+                or not set(OHLC_COLUMNS).issubset(entry["df"].columns)
+            ):
+                print(f"Market cache entry {interval} invalid, ignoring")
+                continue
+            MARKET_CACHE[interval] = entry
+    except Exception as e:
+        print(f"Market cache load error: {e}")
+
+
+def save_market_cache() -> None:
+    try:
+        tmp_file = f"{MARKET_CACHE_FILE}.tmp"
+        pd.to_pickle(dict(MARKET_CACHE), tmp_file)
+        os.replace(tmp_file, MARKET_CACHE_FILE)
+    except Exception as e:
+        print(f"Market cache save error: {e}")
+
+
 def get_market_bundle() -> Dict[str, Any]:
     """
     Returns both 15m and 1h data.
     The 30-minute alert engine uses 15m data but confirms with 1h.
     """
-    df15 = download_interval("10d", "15m")
-    df1h = download_interval("45d", "1h")
+    started = time.time()
+    before = {interval: entry["df"] for interval, entry in MARKET_CACHE.items()}
+    future15 = IO_EXECUTOR.submit(download_interval, "10d", "15m")
+    future1h = IO_EXECUTOR.submit(download_interval, "45d", "1h")
+    df15 = future15.result()
+    df1h = future1h.result()
+
+    # Persist only when a refresh actually changed the cached bars.
+    after = {interval: entry["df"] for interval, entry in MARKET_CACHE.items()}
+    if before.keys() != after.keys() or any(after[k] is not before[k] for k in after):
+        save_market_cache()
 
     price = 0.0
     if df15 is not None and not df15.empty:
-        price = safe_float(df15["Close"].iloc[-1])
+        price = last_value(df15, "Close")
     elif df1h is not None and not df1h.empty:
-        price = safe_float(df1h["Close"].iloc[-1])
+        price = last_value(df1h, "Close")
 
     return {
         "df15": df15,
         "df1h": df1h,
         "price": price,
+        "context": dict(CONTEXT_PRICES),
+        # False when the 1h bars were served from cache within their TTL.
+        "df1h_live": MARKET_CACHE.get("1h", {}).get("fetched_at", 0.0) >= started,
     }
 
 
@@ -552,7 +1073,16 @@ def get_market_bundle() -> Dict[str, Any]:
 # 6. DATA QUALITY CHECK
 # =============================================================================
 
-def check_data_quality(df15: Optional[pd.DataFrame], df1h: Optional[pd.DataFrame]) -> Dict[str, Any]:
+def check_data_quality(
+    df15: Optional[pd.DataFrame],
+    df1h: Optional[pd.DataFrame],
+    df1h_live: bool = True,
+) -> Dict[str, Any]:
+    """
+    df1h_live=False marks a 1h frame served from cache. Its forming-bar close
+    is older than the live 15m close, so the 15m/1h price check compares the
+    last completed 1h bar with the 15m bar that closes at the same time.
+    """
     warnings: List[str] = []
     penalty = 0
 
@@ -569,7 +1099,7 @@ def check_data_quality(df15: Optional[pd.DataFrame], df1h: Optional[pd.DataFrame
             warnings.append(f"15m data may be stale: {age_minutes:.0f} minutes old")
             penalty += 20
 
-        atr15 = safe_float(df15["ATR"].iloc[-1]) if "ATR" in df15.columns else 0
+        atr15 = last_value(df15, "ATR") if "ATR" in df15.columns else 0
         if atr15 <= 0:
             warnings.append("15m ATR unavailable")
             penalty += 15
@@ -582,15 +1112,22 @@ def check_data_quality(df15: Optional[pd.DataFrame], df1h: Optional[pd.DataFrame
             warnings.append("1h data has limited history")
             penalty += 8
 
-        atr1h = safe_float(df1h["ATR"].iloc[-1]) if "ATR" in df1h.columns else 0
+        atr1h = last_value(df1h, "ATR") if "ATR" in df1h.columns else 0
         if atr1h <= 0:
             warnings.append("1h ATR unavailable")
             penalty += 10
 
     if df15 is not None and not df15.empty and df1h is not None and not df1h.empty:
-        p15 = safe_float(df15["Close"].iloc[-1])
-        p1h = safe_float(df1h["Close"].iloc[-1])
-        if abs(p15 - p1h) > PRICE_DISAGREEMENT_LIMIT:
+        p15 = p1h = None
+        if df1h_live:
+            p15 = last_value(df15, "Close")
+            p1h = last_value(df1h, "Close")
+        elif len(df1h) >= 2:
+            ts = df1h.index[-2] + pd.Timedelta(seconds=INTERVAL_SECONDS["1h"] - INTERVAL_SECONDS["15m"])
+            if ts in df15.index:
+                p15 = float(df15["Close"].loc[ts])
+                p1h = float(df1h["Close"].iloc[-2])
+        if p15 is not None and abs(p15 - p1h) > PRICE_DISAGREEMENT_LIMIT:
             warnings.append(f"15m/1h price disagreement: {abs(p15 - p1h):.2f}")
             penalty += 15
 
@@ -656,7 +1193,7 @@ def calculate_universal_channel(slice_data: pd.DataFrame, cutoff_pct: float = 0.
     support_line = [(date_start, lower_channel[0]), (date_end, lower_channel[-1])]
     resistance_line = [(date_start, upper_channel[0]), (date_end, upper_channel[-1])]
 
-    latest_price = safe_float(slice_data["Close"].iloc[-1])
+    latest_price = last_value(slice_data, "Close")
     low_now = lower_channel[-1]
     high_now = upper_channel[-1]
     width = max(0.0001, high_now - low_now)
@@ -713,45 +1250,95 @@ BEARISH_NEWS_KEYWORDS = {
 }
 
 
+NEWS_KEYWORD_WEIGHTS = tuple({**BULLISH_NEWS_KEYWORDS, **BEARISH_NEWS_KEYWORDS}.items())
+
+
+# Every poll re-scores the same feed entries, so scores are memoized per title.
+# The returned dict is shared between calls and must not be mutated.
+@lru_cache(maxsize=1024)
 def score_headline(title: str) -> Dict[str, Any]:
     text = title.lower()
-    score = 0
-    hits: List[str] = []
+    # Plain substring tests are faster here than a regex alternation over
+    # these few dozen keywords, and overlapping keywords both count.
+    matched = [(kw, weight) for kw, weight in NEWS_KEYWORD_WEIGHTS if kw in text]
 
-    for kw, weight in BULLISH_NEWS_KEYWORDS.items():
-        if kw in text:
-            score += weight
-            hits.append(f"{kw}({weight:+})")
+    score = int(clamp(sum(weight for _, weight in matched), -40, 40))
+    direction = "BULLISH" if score > 5 else "BEARISH" if score < -5 else "NEUTRAL"
+    return {"score": score, "direction": direction, "hits": tuple(f"{kw}({weight:+})" for kw, weight in matched)}
 
-    for kw, weight in BEARISH_NEWS_KEYWORDS.items():
-        if kw in text:
-            score += weight
-            hits.append(f"{kw}({weight:+})")
 
-    score = int(clamp(score, -40, 40))
-    direction = "BULLISH" if score > 5 else "BEARISH" if score < -5 else "NEUTRAL"
-    return {"score": score, "direction": direction, "hits": hits}
+# Validators and parsed entries of the last feed download, for conditional GET.
+NEWS_FEED_CACHE: Dict[str, Any] = {"etag": None, "modified": None, "entries": []}
 
 
-def get_news() -> Tuple[List[Dict[str, Any]], List[Any], int]:
+def fetch_news_entries(url: str) -> List[Any]:
+    """
+    Sends the previous ETag/Last-Modified so an unchanged feed comes back as a
+    304 with no body, and reuses the entries parsed last time.
+    """
+    headers: Dict[str, str] = {}
+    if NEWS_FEED_CACHE["etag"]:
+        headers["If-None-Match"] = NEWS_FEED_CACHE["etag"]
+    if NEWS_FEED_CACHE["modified"]:
+        headers["If-Modified-Since"] = NEWS_FEED_CACHE["modified"]
+
+    resp = SESSION.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+    if resp.status_code == 304:
+        return NEWS_FEED_CACHE["entries"]
+    resp.raise_for_status()
+
+    feed = load_feedparser().parse(resp.content)
+    NEWS_FEED_CACHE["etag"] = resp.headers.get("ETag")
+    NEWS_FEED_CACHE["modified"] = resp.headers.get("Last-Modified")
+    NEWS_FEED_CACHE["entries"] = feed.entries
+    save_news_cache()
+    return feed.entries
+
+
+def load_news_cache() -> None:
+    """
+    Restore the feed validators and parsed entries so the first poll after a
+    restart can still be answered with a 304.
+    """
+    if not os.path.exists(NEWS_CACHE_FILE):
+        return
+    try:
+        NEWS_FEED_CACHE.update(pd.read_pickle(NEWS_CACHE_FILE))
+    except Exception as e:
+        print(f"News cache load error: {e}")
+
+
+def save_news_cache() -> None:
+    try:
+        tmp_file = f"{NEWS_CACHE_FILE}.tmp"
+        pd.to_pickle(dict(NEWS_FEED_CACHE), tmp_file)
+        os.replace(tmp_file, NEWS_CACHE_FILE)
+    except Exception as e:
+        print(f"News cache save error: {e}")
+
+
+def get_news() -> Optional[Tuple[List[Dict[str, Any]], List[Any], int, np.ndarray]]:
     """
     Returns:
-        scored headlines, raw feed entries, aggregate news score
+        scored headlines, raw feed entries, aggregate news score,
+        publish times (UTC epoch seconds) aligned with the raw entries;
+        None when the fetch failed, as opposed to an empty feed
     """
     try:
         query = '("Crude Oil" OR "WTI" OR "OPEC" OR "Middle East" OR "Iran" OR "Hormuz") when:2d'
         base_url = "https://news.google.com/rss/search?q={}&hl=en-US&gl=US&ceid=US:en"
         final_url = base_url.format(requests.utils.quote(query))
-        feed = feedparser.parse(final_url)
+        entries = fetch_news_entries(final_url)
 
-        if not feed.entries:
-            return [], [], 0
+        if not entries:
+            return [], [], 0, np.empty(0, dtype=np.int64)
 
         current_time = calendar.timegm(time.gmtime())
         headlines: List[Dict[str, Any]] = []
         raw_entries: List[Any] = []
+        published: List[int] = []
 
-        for entry in feed.entries:
+        for entry in entries:
             if "published_parsed" not in entry:
                 continue
 
@@ -776,26 +1363,81 @@ def get_news() -> Tuple[List[Dict[str, Any]], List[Any], int]:
                     "hits": ", ".join(scoring["hits"]) if scoring["hits"] else "none",
                 })
                 raw_entries.append(entry)
+                published.append(entry_time)
 
             if len(headlines) >= 10:
                 break
 
         aggregate = int(clamp(sum(h["score"] for h in headlines), -60, 60))
-        return headlines, raw_entries, aggregate
+        return headlines, raw_entries, aggregate, np.array(published, dtype=np.int64)
 
     except Exception as e:
         print(f"News fetch error: {e}")
-        return [], [], 0
+        return None
 
 
 # =============================================================================
 # 9. CHART CREATION
 # =============================================================================
 
-def create_chart(df1h: Optional[pd.DataFrame], df15: Optional[pd.DataFrame]) -> Optional[str]:
+# Identity of the bars behind the last rendered chart; skips identical re-renders.
+_chart_cache: Dict[str, Any] = {"key": None, "png": None}
+# The shared figure and _chart_cache are not thread-safe; a background render
+# from an earlier tick may still be running when the next one starts.
+_chart_lock = threading.Lock()
+
+# Chart palette
+CHART_BG = "#0f172a"
+CHART_EDGE = "#1e293b"
+CHART_GRID = "#475569"
+CHART_TEXT = "#e2e8f0"
+CANDLE_UP = "#00E676"
+CANDLE_DOWN = "#D500F9"
+EMA_COLORS = {"EMA21": "#38bdf8", "EMA50": "#f472b6"}
+
+# One Figure/Axes pair reused by every render instead of building a new
+# figure per chart.
+_chart_canvas: Dict[str, Any] = {"fig": None, "ax": None}
+
+
+def get_chart_axes() -> Tuple[Any, Any]:
+    if _chart_canvas["fig"] is None:
+        load_matplotlib()
+        fig = Figure(figsize=(8, 5.75))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        fig.patch.set_facecolor(CHART_BG)
+        _chart_canvas["fig"] = fig
+        _chart_canvas["ax"] = ax
+    return _chart_canvas["fig"], _chart_canvas["ax"]
+
+
+def style_chart_axes(ax: Any) -> None:
+    ax.set_facecolor(CHART_BG)
+    for spine in ax.spines.values():
+        spine.set_color(CHART_EDGE)
+    ax.tick_params(colors=CHART_TEXT, labelsize=8)
+    ax.grid(True, color=CHART_GRID, linestyle="--", linewidth=0.5, alpha=0.6)
+    ax.set_ylabel("Price", color=CHART_TEXT)
+
+
+def quantize_png(png: bytes) -> bytes:
+    """
+    Re-encode with a 256-colour palette. The chart is a handful of flat colours
+    plus antialiasing, so it looks the same at about a third of the size.
+    """
+    buf = io.BytesIO()
+    Image.open(io.BytesIO(png)).convert("RGB").quantize(256).save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+def create_chart(df1h: Optional[pd.DataFrame], df15: Optional[pd.DataFrame]) -> Optional[bytes]:
     """
     Chart uses 1H data when available because it is cleaner for structure.
-    Falls back to 15m.
+    Falls back to 15m. Returns the PNG bytes; nothing is written to disk.
+
+    Candles are drawn as two LineCollections (wicks and bodies) on an integer
+    bar axis, so only a handful of artists are created per render.
     """
     plot_data = df1h.tail(250) if df1h is not None and not df1h.empty else None
     if plot_data is None and df15 is not None and not df15.empty:
@@ -804,81 +1446,101 @@ def create_chart(df1h: Optional[pd.DataFrame], df15: Optional[pd.DataFrame]) ->
     if plot_data is None or plot_data.empty:
         return None
 
-    try:
-        recent_low = safe_float(plot_data.tail(250)["Low"].min())
-        recent_high = safe_float(plot_data.tail(250)["High"].max())
-
-        horizontal_lines = [
-            recent_low,
-            recent_high,
-            MANUAL_LEVELS["major_support_zone"][0],
-            MANUAL_LEVELS["major_support_zone"][1],
-            MANUAL_LEVELS["bullish_reclaim_1"],
-            MANUAL_LEVELS["resistance_zone_1"][0],
-            MANUAL_LEVELS["resistance_zone_1"][1],
-        ]
-
-        macro_exists, macro_sup, macro_res, _ = calculate_universal_channel(plot_data, cutoff_pct=0.92)
-        micro_source = plot_data.tail(70)
-        micro_exists, micro_sup, micro_res, _ = calculate_universal_channel(micro_source, cutoff_pct=0.80)
-
-        mc = mpf.make_marketcolors(
-            up="#00E676",
-            down="#D500F9",
-            edge="inherit",
-            wick="inherit",
-            volume="in",
-        )
-        iq_style = mpf.make_mpf_style(
-            base_mpf_style="nightclouds",
-            marketcolors=mc,
-            facecolor="#0f172a",
-            edgecolor="#1e293b",
-            figcolor="#0f172a",
-        )
-
-        kwargs = dict(
-            type="candle",
-            style=iq_style,
-            volume=False,
-            mav=(21, 50),
-            hlines=dict(
-                hlines=horizontal_lines,
-                colors=["#ffcc00"] * len(horizontal_lines),
-                linestyle="--",
-                linewidths=0.8,
-            ),
-            savefig=dict(fname=CHART_FILE, dpi=120, bbox_inches="tight"),
-        )
-
-        lines_to_draw: List[Any] = []
-        line_colors: List[str] = []
-        line_styles: List[str] = []
-
-        if macro_exists:
-            lines_to_draw.extend([macro_sup, macro_res])
-            line_colors.extend(["white", "gray"])
-            line_styles.extend(["-", "-"])
-
-        if micro_exists:
-            lines_to_draw.extend([micro_sup, micro_res])
-            line_colors.extend(["#00aaff", "#00aaff"])
-            line_styles.extend(["--", "--"])
-
-        if lines_to_draw:
-            kwargs["alines"] = dict(
-                alines=lines_to_draw,
-                colors=line_colors,
-                linestyle=line_styles,
-                linewidths=1.5,
-            )
+    # The last bar may still be forming, so its OHLC is part of the key.
+    last_bar = last_row(plot_data)
+    chart_key = (
+        plot_data.index[0].value,
+        plot_data.index[-1].value,
+        tuple(float(last_bar[c]) for c in OHLC_COLUMNS),
+    )
+    with _chart_lock:
+        if chart_key == _chart_cache["key"] and _chart_cache["png"]:
+            return _chart_cache["png"]
 
-        mpf.plot(plot_data, **kwargs)
-        return CHART_FILE
+        try:
+            o = plot_data["Open"].to_numpy(dtype=float)
+            h = plot_data["High"].to_numpy(dtype=float)
+            l = plot_data["Low"].to_numpy(dtype=float)
+            c = plot_data["Close"].to_numpy(dtype=float)
+
+            recent_low = safe_float(np.nanmin(l))
+            recent_high = safe_float(np.nanmax(h))
+
+            horizontal_lines = [
+                recent_low,
+                recent_high,
+                MANUAL_LEVELS["major_support_zone"][0],
+                MANUAL_LEVELS["major_support_zone"][1],
+                MANUAL_LEVELS["bullish_reclaim_1"],
+                MANUAL_LEVELS["resistance_zone_1"][0],
+                MANUAL_LEVELS["resistance_zone_1"][1],
+            ]
+
+            macro_exists, macro_sup, macro_res, _ = calculate_universal_channel(plot_data, cutoff_pct=0.92)
+            micro_source = plot_data.tail(70)
+            micro_exists, micro_sup, micro_res, _ = calculate_universal_channel(micro_source, cutoff_pct=0.80)
+
+            fig, ax = get_chart_axes()
+            ax.clear()
+            style_chart_axes(ax)
+
+            n = len(plot_data)
+            x = np.arange(n, dtype=float)
+            colors = np.where(c >= o, CANDLE_UP, CANDLE_DOWN)
+
+            # Body width in points: ~70% of the horizontal space per bar.
+            ax_width_pts = ax.get_position().width * fig.get_figwidth() * 72
+            body_width = max(0.8, 0.7 * ax_width_pts / n)
+
+            ax.add_collection(LineCollection(
+                np.stack([np.column_stack([x, l]), np.column_stack([x, h])], axis=1),
+                colors=colors,
+                linewidths=0.7,
+            ))
+            ax.add_collection(LineCollection(
+                np.stack([np.column_stack([x, o]), np.column_stack([x, c])], axis=1),
+                colors=colors,
+                linewidths=body_width,
+            ))
+
+            # Plot the engines' own EMAs; they are warmed up on the full history,
+            # so the lines span the whole window.
+            for column, color in EMA_COLORS.items():
+                if column in plot_data.columns:
+                    ax.plot(x, plot_data[column].to_numpy(dtype=float), color=color, linewidth=0.9)
+
+            for level in horizontal_lines:
+                ax.axhline(level, color="#ffcc00", linestyle="--", linewidth=0.8)
+
+            # Channel endpoints are (timestamp, price); place them on the bar axis.
+            channel_lines: List[Tuple[Any, str, str]] = []
+            if macro_exists:
+                channel_lines.extend([(macro_sup, "white", "-"), (macro_res, "gray", "-")])
+            if micro_exists:
+                channel_lines.extend([(micro_sup, "#00aaff", "--"), (micro_res, "#00aaff", "--")])
+            for points, color, style in channel_lines:
+                xs = plot_data.index.get_indexer([ts for ts, _ in points])
+                ax.plot(xs, [price for _, price in points], color=color, linestyle=style, linewidth=1.5)
+
+            y_values = np.concatenate([l, h, horizontal_lines])
+            pad = (y_values.max() - y_values.min()) * 0.03 or 0.5
+            ax.set_xlim(-1, n)
+            ax.set_ylim(y_values.min() - pad, y_values.max() + pad)
+
+            ticks = np.linspace(0, n - 1, min(n, 6)).astype(int)
+            ax.set_xticks(ticks)
+            ax.set_xticklabels([plot_data.index[i].strftime("%b %d, %H:%M") for i in ticks], rotation=45, ha="right")
+
+            buf = io.BytesIO()
+            fig.savefig(buf, format="png", dpi=80, bbox_inches="tight", facecolor=fig.get_facecolor())
+            png = quantize_png(buf.getvalue())
+            _chart_cache["key"] = chart_key
+            _chart_cache["png"] = png
+            return png
 
-    except Exception as e:
-        print(f"Chart error: {e}")
-        return None
+        except Exception as e:
+            print(f"Chart error: {e}")
+            return None
 
 
 # =============================================================================
@@ -906,7 +1568,7 @@ def calculate_intraday_alert(
 ) -> EngineResult:
 
     factors: List[Factor] = []
-    price = safe_float(df15["Close"].iloc[-1]) if df15 is not None and not df15.empty else 0.0
+    price = last_value(df15, "Close") if df15 is not None and not df15.empty else 0.0
 
     if price <= 0:
         return EngineResult(
@@ -922,8 +1584,8 @@ def calculate_intraday_alert(
             factors=[Factor("Data", "Blocked", -50, "No price data")],
         )
 
-    latest15 = df15.iloc[-1]
-    latest1h = df1h.iloc[-1] if df1h is not None and not df1h.empty else latest15
+    latest15 = last_row(df15)
+    latest1h = last_row(df1h) if df1h is not None and not df1h.empty else latest15
 
     rsi15 = safe_float(latest15.get("RSI"))
     rsi1h = safe_float(latest1h.get("RSI"))
@@ -1203,18 +1865,19 @@ def build_weekend_history_from_15m(df15: Optional[pd.DataFrame]) -> pd.DataFrame
 
     records: List[Dict[str, Any]] = []
     idx = df15.index
+    highs = df15["High"].to_numpy(dtype=float)
+    lows = df15["Low"].to_numpy(dtype=float)
 
     for i in range(1, len(idx) - 3):
         gap_hours = (idx[i] - idx[i - 1]).total_seconds() / 3600
         if gap_hours >= 24:
             pre = df15.iloc[i - 1]
             first = df15.iloc[i]
-            next1 = df15.iloc[i + 1:i + 3]
 
             pre_close = safe_float(pre["Close"])
             reopen_open = safe_float(first["Open"])
-            first_high = safe_float(pd.concat([first.to_frame().T, next1])["High"].max())
-            first_low = safe_float(pd.concat([first.to_frame().T, next1])["Low"].min())
+            first_high = safe_float(np.nanmax(highs[i:i + 3]))
+            first_low = safe_float(np.nanmin(lows[i:i + 3]))
             first_close = safe_float(df15.iloc[i + 2]["Close"]) if i + 2 < len(df15) else safe_float(first["Close"])
 
             spike_up = first_high - reopen_open
@@ -1290,8 +1953,8 @@ def calculate_opening_spike_probability(
     active = is_opening_spike_watch_window()
     factors: List[Factor] = []
 
-    price = safe_float(df15["Close"].iloc[-1]) if df15 is not None and not df15.empty else 0.0
-    latest1h = df1h.iloc[-1] if df1h is not None and not df1h.empty else None
+    price = last_value(df15, "Close") if df15 is not None and not df15.empty else 0.0
+    latest1h = last_row(df1h) if df1h is not None and not df1h.empty else None
 
     # Base probabilities before evidence.
     up = 37.0
@@ -1443,14 +2106,44 @@ def calculate_opening_spike_probability(
 # 12. GEMINI EXPLANATION LAYER
 # =============================================================================
 
-def get_valid_gemini_model() -> str:
-    if not GEMINI_KEY:
-        return "models/gemini-1.5-flash"
+# The key is fixed for the life of the process, so the endpoints are built once.
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+GEMINI_MODELS_URL = f"{GEMINI_API_BASE}/models?key={GEMINI_KEY}"
+GEMINI_STREAM_URL_TEMPLATE = f"{GEMINI_API_BASE}/{{model}}:streamGenerateContent?alt=sse&key={GEMINI_KEY}"
+
+# Discovered model name per API key: {key_id: (model_name, discovered_at)}
+_model_cache: Dict[str, Tuple[str, float]] = {}
+
+
+def model_cache_key(api_key: str) -> str:
+    """Keys are hashed so the API key itself is never written to disk."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def load_model_cache() -> None:
+    if _model_cache or not os.path.exists(MODEL_CACHE_FILE):
+        return
+    try:
+        with open(MODEL_CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for key, (name, ts) in data.items():
+            _model_cache[key] = (str(name), float(ts))
+    except Exception as e:
+        print(f"Model cache load error: {e}")
+
+
+def save_model_cache() -> None:
+    try:
+        with open(MODEL_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump({key: list(value) for key, value in _model_cache.items()}, f)
+    except Exception as e:
+        print(f"Model cache save error: {e}")
+
 
-    url = f"https://generativelanguage.googleapis.com/v1beta/models?key={GEMINI_KEY}"
+def discover_gemini_model() -> Optional[str]:
     try:
-        resp = requests.get(url, timeout=10)
-        data = resp.json()
+        resp = SESSION.get(GEMINI_MODELS_URL, timeout=HTTP_TIMEOUT)
+        data = json_loads(resp.content)
         if "models" in data:
             for model in data["models"]:
                 if "generateContent" in model.get("supportedGenerationMethods", []):
@@ -1459,7 +2152,62 @@ def get_valid_gemini_model() -> str:
             return data["models"][0]["name"]
     except Exception:
         pass
-    return "models/gemini-1.5-flash"
+    return None
+
+
+def get_valid_gemini_model() -> str:
+    if GEMINI_MODEL:
+        return GEMINI_MODEL if GEMINI_MODEL.startswith("models/") else f"models/{GEMINI_MODEL}"
+    if not GEMINI_KEY:
+        return "models/gemini-1.5-flash"
+
+    load_model_cache()
+    key = model_cache_key(GEMINI_KEY)
+    cached = _model_cache.get(key)
+    if cached and time.time() - cached[1] < MODEL_CACHE_TTL_SECONDS:
+        return cached[0]
+
+    name = discover_gemini_model()
+    if name is None:
+        # Keep using a stale discovery rather than guessing.
+        return cached[0] if cached else "models/gemini-1.5-flash"
+
+    _model_cache[key] = (name, time.time())
+    save_model_cache()
+    return name
+
+
+def invalidate_gemini_model() -> None:
+    """Drop the discovered model after a 404 so the next call rediscovers it."""
+    if GEMINI_MODEL or not GEMINI_KEY:
+        return
+    if _model_cache.pop(model_cache_key(GEMINI_KEY), None) is not None:
+        save_model_cache()
+
+
+# Gemini replies keyed by a rounded fingerprint of the market state: {key: (text, created_at)}
+_llm_cache: Dict[Tuple[Any, ...], Tuple[str, float]] = {}
+
+
+def explanation_fingerprint(
+    intraday: EngineResult,
+    opening: OpeningSpikeResult,
+    headlines: List[Dict[str, Any]],
+    data_quality: Dict[str, Any],
+) -> Tuple[Any, ...]:
+    """Rounded enough that a quiet market maps to the same key tick after tick."""
+    return (
+        intraday.action,
+        intraday.direction_bias,
+        round(intraday.entry, 1),
+        round(intraday.score),
+        round(intraday.conviction),
+        opening.active,
+        opening.bias,
+        round(opening.confidence),
+        data_quality.get("status"),
+        tuple(sorted(h["title"][:80] for h in headlines[:3])),
+    )
 
 
 def fallback_explanation(intraday: EngineResult, opening: OpeningSpikeResult, news_score: int) -> str:
@@ -1474,34 +2222,33 @@ def fallback_explanation(intraday: EngineResult, opening: OpeningSpikeResult, ne
     )
 
 
-def ai_explain_result(
-    intraday: EngineResult,
-    opening: OpeningSpikeResult,
-    headlines: List[Dict[str, Any]],
-    data_quality: Dict[str, Any],
-    chart_file: Optional[str],
-) -> str:
-    """
-    Gemini explains the already-calculated model result.
-    It is explicitly forbidden from changing action/probabilities.
-    """
-    if not GEMINI_KEY:
-        return fallback_explanation(intraday, opening, sum(h.get("score", 0) for h in headlines))
+# Static envelope of the generateContent request; only the parts are serialized per call.
+GEMINI_PAYLOAD_PREFIX = b'{"contents":[{"parts":'
+GEMINI_PAYLOAD_SUFFIX = b"}]}"
 
-    model_name = get_valid_gemini_model()
-    news_text = "\n".join([f"- {h['title']} | score {h['score']:+} | {h['direction']}" for h in headlines[:8]])
 
-    intraday_factors = "\n".join([f"- {f.name}: {f.signal}, weight {f.weight:+}, {f.note}" for f in intraday.factors[:12]])
-    opening_factors = "\n".join([f"- {f.name}: {f.signal}, weight {f.weight:+}, {f.note}" for f in opening.factors[:12]])
+def read_gemini_stream(resp: requests.Response) -> str:
+    """Concatenate the text parts of a streamGenerateContent server-sent-event stream."""
+    chunks: List[str] = []
+    for line in resp.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+        event = json_loads(line[5:])
+        for candidate in event.get("candidates", [])[:1]:
+            for part in candidate.get("content", {}).get("parts", []):
+                chunks.append(part.get("text", ""))
+    return "".join(chunks)
+
 
-    prompt = f"""
+# Fixed skeleton of the explanation prompt; only the fields are filled per call.
+GEMINI_PROMPT_TEMPLATE = """
 You are an explanation layer for a trading-alert dashboard.
 
 CRITICAL RULE:
 Do NOT change the model action, probabilities, stops, targets, or confidence.
 Only explain the already-calculated result.
 
-CURRENT TIME: {utc_now_str()}
+CURRENT TIME: {current_time}
 
 30-MINUTE ALERT MODEL:
 Action: {intraday.action}
@@ -1531,9 +2278,12 @@ OPENING SPIKE FACTORS:
 {opening_factors}
 
 DATA QUALITY:
-Status: {data_quality.get('status')}
-Warnings: {data_quality.get('warnings')}
-Penalty: {data_quality.get('penalty')}
+Status: {data_quality_status}
+Warnings: {data_quality_warnings}
+Penalty: {data_quality_penalty}
+
+CROSS-ASSET CONTEXT:
+{context_text}
 
 NEWS:
 {news_text}
@@ -1555,27 +2305,79 @@ OUTPUT FORMAT:
 Maximum 3 bullets explaining why this is more defendable than AI-only decision making.
 """
 
+
+def ai_explain_result(
+    intraday: EngineResult,
+    opening: OpeningSpikeResult,
+    headlines: List[Dict[str, Any]],
+    data_quality: Dict[str, Any],
+    chart_png: Optional[bytes],
+    model_name: Optional[str] = None,
+    context: Optional[Dict[str, Dict[str, float]]] = None,
+) -> str:
+    """
+    Gemini explains the already-calculated model result.
+    It is explicitly forbidden from changing action/probabilities.
+    """
+    if not GEMINI_KEY:
+        return fallback_explanation(intraday, opening, sum(h.get("score", 0) for h in headlines))
+
+    cache_key = explanation_fingerprint(intraday, opening, headlines, data_quality)
+    cached = _llm_cache.get(cache_key)
+    if cached and time.time() - cached[1] < EXPLANATION_CACHE_TTL_SECONDS:
+        return cached[0] + "<br>(cached)"
+
+    model_name = model_name or get_valid_gemini_model()
+    news_text = "\n".join([f"- {h['title']} | score {h['score']:+} | {h['direction']}" for h in headlines[:8]])
+
+    intraday_factors = "\n".join([f"- {f.name}: {f.signal}, weight {f.weight:+}, {f.note}" for f in intraday.factors[:12]])
+    opening_factors = "\n".join([f"- {f.name}: {f.signal}, weight {f.weight:+}, {f.note}" for f in opening.factors[:12]])
+    context_text = "\n".join(
+        [f"- {t}: {c['price']:.2f} ({c['change_pct']:+.2f}% 24h)" for t, c in (context or {}).items()]
+    ) or "- unavailable"
+
+    prompt = GEMINI_PROMPT_TEMPLATE.format_map({
+        "current_time": utc_now_str(),
+        "intraday": intraday,
+        "opening": opening,
+        "intraday_factors": intraday_factors,
+        "opening_factors": opening_factors,
+        "data_quality_status": data_quality.get("status"),
+        "data_quality_warnings": data_quality.get("warnings"),
+        "data_quality_penalty": data_quality.get("penalty"),
+        "context_text": context_text,
+        "news_text": news_text,
+    })
+
     parts: List[Dict[str, Any]] = [{"text": prompt}]
 
-    if chart_file and os.path.exists(chart_file):
-        try:
-            with open(chart_file, "rb") as f:
-                encoded_image = base64.b64encode(f.read()).decode("utf-8")
-            parts.append({"inline_data": {"mime_type": "image/png", "data": encoded_image}})
-        except Exception:
-            pass
+    if chart_png:
+        encoded_image = base64.b64encode(chart_png).decode("utf-8")
+        parts.append({"inline_data": {"mime_type": "image/png", "data": encoded_image}})
 
     try:
-        url = f"https://generativelanguage.googleapis.com/v1beta/{model_name}:generateContent?key={GEMINI_KEY}"
-        resp = requests.post(
-            url,
-            json={"contents": [{"parts": parts}]},
+        with SESSION.post(
+            GEMINI_STREAM_URL_TEMPLATE.format(model=model_name),
+            data=GEMINI_PAYLOAD_PREFIX + json_dumps_bytes(parts) + GEMINI_PAYLOAD_SUFFIX,
             headers={"Content-Type": "application/json"},
-            timeout=25,
-        )
-        if resp.status_code == 200:
-            text = resp.json()["candidates"][0]["content"]["parts"][0]["text"]
-            return text.replace("\n", "<br>")
+            stream=True,
+            timeout=GEMINI_STREAM_TIMEOUT,
+        ) as resp:
+            # Quota/model errors arrive as the status line, before any generation.
+            if resp.status_code != 200:
+                if resp.status_code == 404:
+                    # The cached model was retired or renamed.
+                    invalidate_gemini_model()
+                return fallback_explanation(intraday, opening, sum(h.get("score", 0) for h in headlines))
+            text = read_gemini_stream(resp)
+
+        if text:
+            text = text.replace("\n", "<br>")
+            now = time.time()
+            for key in [k for k, (_, ts) in _llm_cache.items() if now - ts >= EXPLANATION_CACHE_TTL_SECONDS]:
+                del _llm_cache[key]
+            _llm_cache[cache_key] = (text, now)
+            return text
         return fallback_explanation(intraday, opening, sum(h.get("score", 0) for h in headlines))
     except Exception:
         return fallback_explanation(intraday, opening, sum(h.get("score", 0) for h in headlines))
@@ -1585,31 +2387,48 @@ Maximum 3 bullets explaining why this is more defendable than AI-only decision m
 # 13. TELEGRAM
 # =============================================================================
 
+TELEGRAM_API_BASE = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}"
+TELEGRAM_SEND_PHOTO_URL = f"{TELEGRAM_API_BASE}/sendPhoto"
+TELEGRAM_SEND_MESSAGE_URL = f"{TELEGRAM_API_BASE}/sendMessage"
+
+
 def telegram_enabled() -> bool:
     return bool(TELEGRAM_TOKEN and TELEGRAM_CHAT_ID)
 
 
-def send_telegram_message(text: str, chart_file: Optional[str] = None) -> None:
+# Digest of the last chart delivered, so an unchanged chart (closed market,
+# no new bars) is not uploaded again.
+_last_sent_chart: Dict[str, Optional[bytes]] = {"digest": None}
+
+
+def send_telegram_message(text: str, chart_png: Optional[bytes] = None) -> None:
     if not telegram_enabled():
         return
 
-    base_url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}"
-
     try:
-        if SEND_CHART_WITH_TELEGRAM and chart_file and os.path.exists(chart_file):
-            with open(chart_file, "rb") as f:
-                requests.post(
-                    f"{base_url}/sendPhoto",
-                    data={"chat_id": TELEGRAM_CHAT_ID},
-                    files={"photo": f},
-                    timeout=15,
-                )
+        chart_digest = hashlib.blake2b(chart_png, digest_size=16).digest() if chart_png else None
+        if SEND_CHART_WITH_TELEGRAM and chart_png and chart_digest != _last_sent_chart["digest"]:
+            # Short reports ride along as the photo caption: one request instead of two.
+            as_caption = len(text.encode("utf-16-le")) // 2 <= TELEGRAM_CAPTION_LIMIT  # Telegram counts UTF-16 units
+            data = {"chat_id": TELEGRAM_CHAT_ID}
+            if as_caption:
+                data["caption"] = text
+            resp = SESSION.post(
+                TELEGRAM_SEND_PHOTO_URL,
+                data=data,
+                files={"photo": (CHART_FILENAME, chart_png, "image/png")},
+                timeout=HTTP_TIMEOUT,
+            )
+            if resp.ok:
+                _last_sent_chart["digest"] = chart_digest
+            if as_caption and resp.ok:
+                return
 
         # Telegram markdown can break easily with symbols, so plain text is safer.
-        requests.post(
-            f"{base_url}/sendMessage",
+        SESSION.post(
+            TELEGRAM_SEND_MESSAGE_URL,
             data={"chat_id": TELEGRAM_CHAT_ID, "text": text},
-            timeout=15,
+            timeout=HTTP_TIMEOUT,
         )
     except Exception as e:
         print(f"Telegram error: {e}")
@@ -1740,8 +2559,8 @@ def update_dashboard_raw(bundle: Dict[str, Any], headlines: List[Dict[str, Any]]
     df1h = bundle.get("df1h")
     price = bundle.get("price", 0.0)
 
-    latest15 = df15.iloc[-1] if df15 is not None and not df15.empty else None
-    latest1h = df1h.iloc[-1] if df1h is not None and not df1h.empty else None
+    latest15 = last_row(df15) if df15 is not None and not df15.empty else None
+    latest1h = last_row(df1h) if df1h is not None and not df1h.empty else None
 
     DASHBOARD_DATA["price"] = price
     DASHBOARD_DATA["news"] = headlines
@@ -1759,20 +2578,56 @@ def update_dashboard_raw(bundle: Dict[str, Any], headlines: List[Dict[str, Any]]
         DASHBOARD_DATA["rsi1h"] = safe_float(latest1h.get("RSI"))
         DASHBOARD_DATA["atr1h"] = safe_float(latest1h.get("ATR"))
         DASHBOARD_DATA["ema_status_1h"] = "BULLISH 21>50" if safe_float(latest1h.get("EMA21")) > safe_float(latest1h.get("EMA50")) else "BEARISH 21<50"
-
-    if latest1h is not None:
         DASHBOARD_DATA["trend"] = "BULLISH 🟢" if safe_float(latest1h.get("MACD_HIST")) > 0 else "BEARISH 🔴"
 
 
+def news_poll_interval(published: np.ndarray) -> float:
+    """Poll at a quarter of the newest headline's age, within the configured bounds."""
+    if len(published) == 0:
+        return float(NEWS_POLL_MAX_SECONDS)
+    newest_age = calendar.timegm(time.gmtime()) - int(published.max())
+    return float(clamp(newest_age / 4, NEWS_POLL_MIN_SECONDS, NEWS_POLL_MAX_SECONDS))
+
+
+def next_bucket(now: float, interval: float, offset: float = 0.0) -> float:
+    """Next wall-clock multiple of `interval` after `now`, plus `offset`."""
+    return (now // interval + 1) * interval + offset
+
+
+def remember_news_link(seen: "OrderedDict[str, float]", link: str) -> None:
+    """Record `link`; evict from the oldest end by age and size."""
+    now = time.time()
+    seen[link] = now
+    seen.move_to_end(link)
+    while seen and (len(seen) > SEEN_NEWS_MAX_LINKS or now - next(iter(seen.values())) > SEEN_NEWS_TTL_SECONDS):
+        seen.popitem(last=False)
+
+
+def sleep_until(*deadlines: float) -> None:
+    time.sleep(max(1.0, min(deadlines) - time.time()))
+
+
 def run_bot() -> None:
     global DASHBOARD_DATA
 
-    last_intraday_report_time = 0.0
+    next_intraday_report_time = 0.0
     last_opening_preview_time = 0.0
     last_opening_active_time = 0.0
     last_price = 0.0
+    # Price before the latest market refresh; the fast-spike reference.
+    spike_ref_price = 0.0
     last_opening_bias_sent = ""
-    seen_news_links: set = set()
+    seen_news_links: "OrderedDict[str, float]" = OrderedDict()
+
+    load_market_cache()
+    load_news_cache()
+
+    # Market data and news run on separate timers; each wake refreshes
+    # whichever is due and reuses the last result of the other.
+    next_market_time = 0.0
+    next_news_time = 0.0
+    bundle: Dict[str, Any] = {}
+    news: Tuple[List[Dict[str, Any]], List[Any], int, np.ndarray] = ([], [], 0, np.empty(0, dtype=np.int64))
 
     while True:
         try:
@@ -1780,33 +2635,41 @@ def run_bot() -> None:
             DASHBOARD_DATA["session"] = asdict(session)
             DASHBOARD_DATA["status"] = f"Fetching market data... [{session.mode}]"
 
-            bundle = get_market_bundle()
+            now = time.time()
+            # A timer due within the next second is served now rather than
+            # costing a separate wake.
+            market_refreshed = now + 1.0 >= next_market_time or not bundle
+            news_future = None
+            if now + 1.0 >= next_news_time:
+                # News does not depend on market data; fetch both at once.
+                news_future = IO_EXECUTOR.submit(get_news)
+                next_news_time = now + NEWS_POLL_MAX_SECONDS
+            if market_refreshed:
+                next_market_time = next_bucket(now, LOOP_SLEEP_SECONDS, BAR_CLOSE_GRACE_SECONDS)
+                bundle = get_market_bundle()
             df15 = bundle.get("df15")
             df1h = bundle.get("df1h")
             price = bundle.get("price", 0.0)
 
-            headlines, raw_entries, news_score = get_news()
-            data_quality = check_data_quality(df15, df1h)
+            if news_future is not None:
+                fetched = news_future.result()
+                if fetched is None:
+                    # Keep the last good news and retry soon instead of backing off.
+                    next_news_time = now + NEWS_POLL_MIN_SECONDS
+                else:
+                    news = fetched
+                    next_news_time = now + news_poll_interval(news[3])
+            headlines, raw_entries, news_score, news_published = news
+            data_quality = check_data_quality(df15, df1h, bundle.get("df1h_live", True))
 
             update_dashboard_raw(bundle, headlines, news_score, data_quality)
             DASHBOARD_DATA["session"] = asdict(session)
 
             if df15 is None or df15.empty or df1h is None or df1h.empty:
                 DASHBOARD_DATA["status"] = f"Waiting for enough market data... [{session.mode}]"
-                time.sleep(LOOP_SLEEP_SECONDS)
+                sleep_until(next_market_time, next_news_time)
                 continue
 
-            DASHBOARD_DATA["status"] = f"Calculating engines... [{session.mode}]"
-
-            intraday = calculate_intraday_alert(df15, df1h, news_score, data_quality, last_price)
-            opening = calculate_opening_spike_probability(df15, df1h, news_score, data_quality)
-
-            DASHBOARD_DATA["intraday"] = asdict(intraday)
-            DASHBOARD_DATA["opening_spike"] = asdict(opening)
-            DASHBOARD_DATA["factor_table"] = [asdict(f) for f in intraday.factors]
-            DASHBOARD_DATA["opening_factor_table"] = [asdict(f) for f in opening.factors]
-            DASHBOARD_DATA["calibration"] = get_calibration_summary()
-
             current_time = time.time()
 
             # -----------------------------------------------------------------
@@ -1815,12 +2678,15 @@ def run_bot() -> None:
             # Normal 30-minute reports are allowed only in WEEKDAY_30MIN_ACTIVE.
             intraday_due = (
                 session.allow_intraday_alerts
-                and (current_time - last_intraday_report_time) >= MAIN_REPORT_INTERVAL_SECONDS
+                and current_time >= next_intraday_report_time
             )
 
             # Fast price-spike alerts are allowed only in weekday intraday mode.
+            # Price only moves on a market refresh, not on news-only wakes.
+            if market_refreshed:
+                spike_ref_price = last_price
             fast_spike_event = False
-            if session.allow_fast_spike_alerts and last_price > 0 and abs(price - last_price) >= FAST_SPIKE_THRESHOLD:
+            if market_refreshed and session.allow_fast_spike_alerts and spike_ref_price > 0 and abs(price - spike_ref_price) >= FAST_SPIKE_THRESHOLD:
                 fast_spike_event = True
 
             # Breaking news can trigger a report only in session modes that allow it.
@@ -1828,15 +2694,22 @@ def run_bot() -> None:
             breaking_news_title = ""
             if session.allow_breaking_news_alerts:
                 current_utc = calendar.timegm(time.gmtime())
-                for entry in raw_entries:
-                    if "published_parsed" in entry:
-                        age_seconds = current_utc - calendar.timegm(entry.published_parsed)
-                        link = entry.get("link", "")
-                        if age_seconds < FRESH_NEWS_SECONDS and link not in seen_news_links:
-                            breaking_news_event = True
-                            breaking_news_title = clean_title(entry.get("title", ""))
-                            seen_news_links.add(link)
-                            break
+                fresh_mask = (current_utc - news_published) < FRESH_NEWS_SECONDS
+                for i in np.flatnonzero(fresh_mask):
+                    entry = raw_entries[i]
+                    link = entry.get("link", "")
+                    if link not in seen_news_links:
+                        breaking_news_event = True
+                        breaking_news_title = clean_title(entry.get("title", ""))
+                        remember_news_link(seen_news_links, link)
+                        break
+
+            # A news-only wake has nothing new for the engines unless a story breaks;
+            # the scheduled reports are picked up on the next market wake.
+            if not market_refreshed and not breaking_news_event:
+                DASHBOARD_DATA["status"] = f"Monitoring active [{session.mode}]"
+                sleep_until(next_market_time, next_news_time)
+                continue
 
             # Friday 6 PM local / weekend preview: send opening-spike probability
             # messages on the preview cadence. Do not require a strong edge; the
@@ -1848,6 +2721,24 @@ def run_bot() -> None:
                 and (current_time - last_opening_preview_time) >= PRE_OPEN_PREVIEW_INTERVAL_SECONDS
             )
 
+            # The chart does not depend on the engines. When a report is already
+            # certain, render it in the background while they run. Muted reports
+            # still use it to keep the dashboard chart current.
+            chart_future = None
+            if fast_spike_event or breaking_news_event or opening_preview_due or intraday_due:
+                chart_future = IO_EXECUTOR.submit(create_chart, df1h, df15)
+
+            DASHBOARD_DATA["status"] = f"Calculating engines... [{session.mode}]"
+
+            intraday = calculate_intraday_alert(df15, df1h, news_score, data_quality, spike_ref_price)
+            opening = calculate_opening_spike_probability(df15, df1h, news_score, data_quality)
+
+            DASHBOARD_DATA["intraday"] = asdict(intraday)
+            DASHBOARD_DATA["opening_spike"] = asdict(opening)
+            DASHBOARD_DATA["factor_table"] = [asdict(f) for f in intraday.factors]
+            DASHBOARD_DATA["opening_factor_table"] = [asdict(f) for f in opening.factors]
+            DASHBOARD_DATA["calibration"] = get_calibration_summary()
+
             # Reopen window: opening-spike active alerts.
             opening_active_due = (
                 session.allow_opening_active_alerts
@@ -1863,7 +2754,7 @@ def run_bot() -> None:
             report_type = "NONE"
 
             if fast_spike_event:
-                diff = price - last_price
+                diff = price - spike_ref_price
                 alert_reason = f"FAST PRICE SPIKE {diff:+.2f}"
                 report_type = "INTRADAY"
             elif breaking_news_event:
@@ -1889,23 +2780,6 @@ def run_bot() -> None:
             should_generate_report = report_type != "NONE"
 
             if should_generate_report:
-                chart = create_chart(df1h, df15)
-                DASHBOARD_DATA["status"] = f"Generating explanation... [{session.mode}]"
-                explanation = ai_explain_result(intraday, opening, headlines, data_quality, chart)
-                DASHBOARD_DATA["analysis"] = explanation
-
-                # Log only the relevant model.
-                if report_type == "INTRADAY":
-                    log_intraday_result(intraday, news_score, data_quality)
-                    last_intraday_report_time = current_time
-                else:
-                    log_opening_spike_result(opening, price, news_score)
-                    if report_type == "OPENING_PREVIEW":
-                        last_opening_preview_time = current_time
-                    if report_type == "OPENING":
-                        last_opening_active_time = current_time
-                        last_opening_bias_sent = opening.bias
-
                 # Final Telegram permission gate.
                 should_send = True
 
@@ -1927,7 +2801,20 @@ def run_bot() -> None:
                 # even when the result is NO CLEAN EDGE, because the user wants the
                 # probability feed before the market opens.
 
+                decisive = (
+                    report_type == "INTRADAY"
+                    and GEMINI_SKIP_ABS_SCORE > 0
+                    and abs(intraday.score) >= GEMINI_SKIP_ABS_SCORE
+                )
+
+                telegram_future = None
                 if should_send:
+                    # Model discovery runs while the chart renders.
+                    model_future = None if decisive else IO_EXECUTOR.submit(get_valid_gemini_model)
+                    chart = chart_future.result() if chart_future is not None else create_chart(df1h, df15)
+
+                    # The Telegram text does not include the explanation, so the
+                    # alert goes out while Gemini is still generating.
                     telegram_text = build_telegram_text(
                         f"{alert_reason} | SESSION: {session.mode}",
                         intraday,
@@ -1935,16 +2822,56 @@ def run_bot() -> None:
                         data_quality,
                         news_score,
                     )
-                    send_telegram_message(telegram_text, chart)
+                    # A STRICT WAIT that still goes out (spike or breaking news) has no
+                    # trade to chart; send it as text and keep the render for the dashboard.
+                    wait_alert = report_type == "INTRADAY" and intraday.action == "STRICT WAIT"
+                    telegram_future = IO_EXECUTOR.submit(
+                        send_telegram_message, telegram_text, None if wait_alert else chart
+                    )
+
+                    if model_future is None:
+                        explanation = fallback_explanation(intraday, opening, news_score)
+                    else:
+                        DASHBOARD_DATA["status"] = f"Generating explanation... [{session.mode}]"
+                        explanation = ai_explain_result(
+                            intraday, opening, headlines, data_quality, chart, model_future.result(), bundle.get("context")
+                        )
+                else:
+                    # Muted report: nothing leaves the bot, so skip Gemini and Telegram.
+                    # The chart still renders for the dashboard.
+                    if chart_future is None:
+                        create_chart(df1h, df15)
+                    else:
+                        chart_future.result()
+                    explanation = fallback_explanation(intraday, opening, news_score)
+                DASHBOARD_DATA["analysis"] = explanation
+
+                # Log only the relevant model.
+                if report_type == "INTRADAY":
+                    log_intraday_result(intraday, news_score, data_quality)
+                    next_intraday_report_time = next_bucket(
+                        current_time, MAIN_REPORT_INTERVAL_SECONDS, BAR_CLOSE_GRACE_SECONDS
+                    )
+                else:
+                    log_opening_spike_result(opening, price, news_score)
+                    if report_type == "OPENING_PREVIEW":
+                        last_opening_preview_time = current_time
+                    if report_type == "OPENING":
+                        last_opening_active_time = current_time
+                        last_opening_bias_sent = opening.bias
+
+                if telegram_future is not None:
+                    telegram_future.result()
 
-            last_price = price
+            if market_refreshed:
+                last_price = price
             DASHBOARD_DATA["status"] = f"Monitoring active [{session.mode}]"
 
         except Exception as e:
             DASHBOARD_DATA["status"] = f"Error: {e}"
             print(f"Bot error: {e}")
 
-        time.sleep(LOOP_SLEEP_SECONDS)
+        sleep_until(next_market_time, next_news_time)
 
 
 # =============================================================================
@@ -2217,8 +3144,8 @@ def dashboard():
 
 @app.route("/chart")
 def serve_chart():
-    if os.path.exists(CHART_FILE):
-        return send_file(CHART_FILE, mimetype="image/png")
+    if _chart_cache["png"]:
+        return send_file(io.BytesIO(_chart_cache["png"]), mimetype="image/png")
     return "Chart generating. Refresh shortly.", 404
 
 